@@ -1,15 +1,110 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import atexit
 import math
-import requests
 import json
 import time
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+import os
+import sys
+import functools
+import operator
+import re
+import threading
+from bisect import bisect_left, bisect_right
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+from dataclasses import astuple, dataclass
 
+if TYPE_CHECKING:
+    import mmap
+    import numpy as np  # NumPy n'est importé qu'à la première analyse de portefeuille
+    import requests
 
-@dataclass
+try:
+    import orjson
+    _charger_json = orjson.loads  # Parseur natif, plus rapide sur les réponses riches en nombres
+except ImportError:
+    _charger_json = json.loads
+
+
+def _float_ou_defaut(valeur: str, default: float = 0.0) -> float:
+    """
+    Conversion texte -> float utilisée quand fastnumbers n'est pas installé
+    """
+    try:
+        return float(valeur)
+    except (TypeError, ValueError):
+        return default
+
+
+# Valeurs renvoyées par l'API lorsqu'une donnée est absente
+_VALEURS_VIDES = frozenset(("", "None", "-", "null", "NaN"))
+
+
+# Durées de validité du cache par fonction de l'API (en secondes)
+TTL_RECHERCHE = 30 * 24 * 3600  # SYMBOL_SEARCH: les symboles changent rarement
+TTL_APERCU = 24 * 3600  # OVERVIEW: prix et ratios mis à jour quotidiennement
+TTL_ETATS_FINANCIERS = 7 * 24 * 3600  # INCOME_STATEMENT / BALANCE_SHEET: publiés chaque trimestre
+
+# Champs réellement utilisés par l'analyse: seuls ceux-ci sont conservés (et mis en cache)
+CHAMPS_APERCU = ("Name", "Symbol", "50DayMovingAverage", "PreviousClose", "EPS", "BookValue",
+                 "MarketCapitalization", "PERatio", "PEGRatio", "Sector")
+CHAMPS_REVENUS = ("totalRevenue",)
+CHAMPS_BILAN = ("totalDebt", "longTermDebt", "totalShareholderEquity")
+_LIRE_REVENUS = operator.itemgetter(*CHAMPS_REVENUS)
+_LIRE_BILAN = operator.itemgetter(*CHAMPS_BILAN)
+
+
+def _compiler_motif(champs: Tuple[str, ...]) -> "re.Pattern[bytes]":
+    """
+    Compile une expression qui capture les paires "champ": "valeur" pour les champs donnés
+    (Alpha Vantage renvoie toutes les valeurs sous forme de chaînes)
+    """
+    cles = b"|".join(re.escape(champ.encode("ascii")) for champ in champs)
+    return re.compile(rb'"(' + cles + rb')"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+
+_MOTIF_APERCU = _compiler_motif(CHAMPS_APERCU)
+_MOTIF_REVENUS = _compiler_motif(CHAMPS_REVENUS)
+_MOTIF_BILAN = _compiler_motif(CHAMPS_BILAN)
+
+
+def _extraire_champs(motif: "re.Pattern[bytes]", contenu: bytes) -> Dict[str, str]:
+    """
+    Extrait en une seule passe les champs ciblés d'une réponse JSON au schéma connu,
+    sans décoder le reste du document (la première occurrence de chaque champ est gardée)
+    """
+    champs = {}
+    for correspondance in motif.finditer(contenu):
+        cle = correspondance.group(1).decode("ascii")
+        if cle not in champs:
+            valeur = correspondance.group(2)
+            # Les séquences d'échappement (rares) sont confiées au parseur JSON
+            champs[cle] = _charger_json(b'"' + valeur + b'"') if b"\\" in valeur else valeur.decode("utf-8")
+    return champs
+
+DOSSIER_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+FICHIER_CACHE_ENTREPRISES = os.path.join(DOSSIER_CACHE, "entreprises.bin")
+
+# Mapping des secteurs de l'API (en anglais) vers les secteurs français
+SECTEURS_MAPPING = {
+    "TECHNOLOGY": "technologie",
+    "FINANCIAL SERVICES": "finance",
+    "HEALTHCARE": "sante",
+    "INDUSTRIALS": "industrie",
+    "CONSUMER DISCRETIONARY": "consommation",
+    "CONSUMER STAPLES": "consommation",
+    "ENERGY": "energie",
+    "UTILITIES": "energie",
+    "MATERIALS": "industrie",
+    "REAL ESTATE": "finance",
+    "COMMUNICATION SERVICES": "technologie"
+}
+_SECTEURS_LUT = {sys.intern(cle): secteur for cle, secteur in SECTEURS_MAPPING.items()}
+
+
+@dataclass(frozen=True, slots=True)
 class DonneesEntreprise:
     """Structure pour stocker les données financières d'une entreprise"""
     nom: str
@@ -26,34 +121,425 @@ class DonneesEntreprise:
     capitalisation_boursiere: float
 
 
+@dataclass
+class PortefeuilleSoA:
+    """
+    Données de plusieurs entreprises stockées par colonnes (un tableau NumPy par champ)
+    pour analyser un portefeuille entier en opérations vectorisées
+    """
+    noms: List[str]
+    prix: "np.ndarray"
+    eps: "np.ndarray"
+    bvps: "np.ndarray"
+    revenus_actuels: "np.ndarray"
+    revenus_precedents: "np.ndarray"
+    dette: "np.ndarray"
+    capitaux_propres: "np.ndarray"
+    croissance_prevue: "np.ndarray"
+    secteur_id: "np.ndarray"  # Indice du secteur dans la table des références
+    
+    @classmethod
+    def depuis_donnees(cls, entreprises: List[DonneesEntreprise],
+                       index_secteurs: Dict[str, int], secteur_defaut: int) -> "PortefeuilleSoA":
+        """
+        Construit le portefeuille à partir d'une liste de DonneesEntreprise
+        """
+        import numpy as np
+        
+        def colonne(champ: str) -> "np.ndarray":
+            return np.fromiter((getattr(e, champ) for e in entreprises), dtype=np.float64, count=len(entreprises))
+        
+        return cls(
+            noms=[e.nom for e in entreprises],
+            prix=colonne("prix_action"),
+            eps=colonne("benefice_par_action"),
+            bvps=colonne("valeur_comptable_par_action"),
+            revenus_actuels=colonne("revenus_actuels"),
+            revenus_precedents=colonne("revenus_annee_precedente"),
+            dette=colonne("dette_totale"),
+            capitaux_propres=colonne("capitaux_propres"),
+            croissance_prevue=colonne("croissance_benefices_prevue"),
+            secteur_id=np.fromiter((index_secteurs.get(e.secteur, secteur_defaut) for e in entreprises),
+                                   dtype=np.int8, count=len(entreprises))
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ReferencesSecteur:
+    """Valeurs de référence moyennes d'un secteur"""
+    pe_moyen: float
+    pb_moyen: float
+    croissance_moyenne: float
+
+
+# Valeurs de référence moyennes par secteur (exemples réalistes)
+REFERENCES_SECTEUR = {
+    "technologie": ReferencesSecteur(pe_moyen=25, pb_moyen=4.5, croissance_moyenne=15),
+    "finance": ReferencesSecteur(pe_moyen=12, pb_moyen=1.2, croissance_moyenne=8),
+    "sante": ReferencesSecteur(pe_moyen=18, pb_moyen=3.0, croissance_moyenne=12),
+    "industrie": ReferencesSecteur(pe_moyen=16, pb_moyen=2.5, croissance_moyenne=6),
+    "consommation": ReferencesSecteur(pe_moyen=20, pb_moyen=3.5, croissance_moyenne=10),
+    "energie": ReferencesSecteur(pe_moyen=14, pb_moyen=1.8, croissance_moyenne=5),
+    "defaut": ReferencesSecteur(pe_moyen=18, pb_moyen=2.8, croissance_moyenne=10)
+}
+
+
+@functools.lru_cache(maxsize=16)
+def _secteur_francais(secteur_api: str) -> str:
+    """
+    Convertit un secteur de l'API en secteur français (résultat mémorisé)
+    """
+    # L'API renvoie déjà les secteurs en majuscules: on évite alors de recréer la chaîne
+    secteur_upper = secteur_api if secteur_api.isupper() else secteur_api.upper()
+    return _SECTEURS_LUT.get(secteur_upper, "defaut")
+
+
+@functools.lru_cache(maxsize=16)
+def _references_secteur(secteur: str) -> ReferencesSecteur:
+    """
+    Retourne les références d'un secteur, ou celles par défaut s'il est inconnu (résultat mémorisé)
+    """
+    return REFERENCES_SECTEUR.get(secteur, REFERENCES_SECTEUR["defaut"])
+
+
+class LimiteurDebit:
+    """
+    Limite le nombre de requêtes sur une fenêtre glissante (ex: 5 requêtes/minute)
+    N'attend que si la limite est atteinte, jamais lors des lectures en cache
+    """
+    
+    def __init__(self, nb_requetes: int, periode: float):
+        self.nb_requetes = nb_requetes
+        self.periode = periode
+        self.appels = deque()
+        self.verrou = threading.Lock()
+    
+    def acquerir(self) -> None:
+        """
+        Bloque jusqu'à ce qu'une requête puisse être envoyée sans dépasser la limite
+        """
+        with self.verrou:
+            maintenant = time.monotonic()
+            while self.appels and maintenant - self.appels[0] >= self.periode:
+                self.appels.popleft()
+            
+            if len(self.appels) >= self.nb_requetes:
+                attente = self.periode - (maintenant - self.appels.popleft())
+                print(f"⏳ Limite de {self.nb_requetes} requêtes/{self.periode:g} s atteinte, "
+                      f"attente de {attente:.0f} s...")
+                time.sleep(attente)
+            
+            self.appels.append(time.monotonic())
+
+
+class CacheFichier:
+    """
+    Cache disque des réponses de l'API, un fichier JSON par requête
+    Format: .cache/{fonction}/{cle}.json contenant {"ts": horodatage, "data": réponse}
+    """
+    
+    def __init__(self, dossier: str = DOSSIER_CACHE):
+        self.dossier = dossier
+    
+    def chemin(self, fonction: str, parametre: str) -> str:
+        """
+        Construit le chemin du fichier de cache pour une requête donnée
+        """
+        import hashlib
+        
+        cle = hashlib.md5(f"{fonction}:{parametre}".encode("utf-8")).hexdigest()
+        return os.path.join(self.dossier, fonction, f"{cle}.json")
+    
+    def lire(self, fonction: str, parametre: str) -> Optional[Dict[str, Any]]:
+        """
+        Retourne l'entrée {"ts", "data"} en cache, ou None si absente ou illisible
+        """
+        try:
+            with open(self.chemin(fonction, parametre), "rb") as fichier:
+                return _charger_json(fichier.read())
+        except (OSError, ValueError):
+            return None
+    
+    def ecrire(self, fonction: str, parametre: str, data: Any) -> float:
+        """
+        Enregistre une réponse (écriture atomique pour ne jamais laisser de fichier tronqué)
+        et retourne son horodatage
+        """
+        chemin = self.chemin(fonction, parametre)
+        horodatage = time.time()
+        try:
+            os.makedirs(os.path.dirname(chemin), exist_ok=True)
+            temporaire = f"{chemin}.{os.getpid()}.tmp"
+            with open(temporaire, "w", encoding="utf-8") as fichier:
+                json.dump({"ts": horodatage, "data": data}, fichier)
+            os.replace(temporaire, chemin)
+        except OSError as e:
+            print(f"⚠️ Impossible d'écrire dans le cache: {e}")
+        return horodatage
+
+
+class CacheCompact:
+    """
+    Cache des DonneesEntreprise déjà assemblées: un seul fichier en ajout seul
+    (enregistrements pickle protocole 5) lu par mmap, et un index {symbole: (position, longueur)}
+    Obtenue par partage(), l'instance est commune à tous les récupérateurs: l'index n'est chargé
+    et le fichier projeté qu'une fois, une relecture coûte ensuite une tranche de mémoire et un pickle.loads
+    """
+    
+    _instances: Dict[str, "CacheCompact"] = {}
+    _verrou_instances = threading.Lock()
+    
+    @classmethod
+    def partage(cls, chemin: str = FICHIER_CACHE_ENTREPRISES) -> "CacheCompact":
+        """
+        Retourne l'instance commune pour ce fichier (créée au premier appel)
+        """
+        with cls._verrou_instances:
+            instance = cls._instances.get(chemin)
+            if instance is None:
+                instance = cls._instances[chemin] = cls(chemin)
+            return instance
+    
+    def __init__(self, chemin: str = FICHIER_CACHE_ENTREPRISES):
+        self.chemin = chemin
+        self.chemin_index = chemin + ".idx"
+        self.verrou = threading.Lock()
+        self._vue = None
+        
+        # Imports différés ici et dans les méthodes: ce cache ne sert qu'aux analyses via l'API
+        import pickle
+        
+        try:
+            with open(self.chemin_index, "rb") as fichier:
+                self._index = pickle.load(fichier)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            self._index = {}
+    
+    def _projection(self) -> Optional["mmap.mmap"]:
+        """
+        Retourne la projection mémoire du fichier (ouverte à la demande, None s'il est vide)
+        """
+        import mmap
+        
+        if self._vue is None:
+            try:
+                with open(self.chemin, "rb") as fichier:
+                    self._vue = mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):  # Fichier absent ou vide
+                return None
+        return self._vue
+    
+    def lire(self, symbole: str) -> Optional[DonneesEntreprise]:
+        """
+        Retourne les données en cache pour ce symbole, ou None si absentes ou expirées
+        """
+        import pickle
+        
+        with self.verrou:
+            emplacement = self._index.get(symbole)
+            if emplacement is None:
+                return None
+            vue = self._projection()
+            position, longueur = emplacement
+            if vue is None or position + longueur > len(vue):
+                return None
+            try:
+                symbole_lu, expiration, valeurs = pickle.loads(vue[position:position + longueur])
+                donnees = DonneesEntreprise(*valeurs)
+            except Exception:
+                return None
+        
+        # Index et fichier désaccordés (compactage interrompu): l'enregistrement n'est pas le bon
+        if symbole_lu != symbole:
+            return None
+        
+        if time.time() >= expiration:
+            return None
+        return donnees
+    
+    def _compacter(self) -> None:
+        """
+        Réécrit le fichier avec les seuls enregistrements encore indexés
+        """
+        if self._vue is not None:
+            self._vue.close()
+            self._vue = None
+        
+        with open(self.chemin, "rb") as fichier:
+            contenu = fichier.read()
+        
+        index = {}
+        temporaire = f"{self.chemin}.{os.getpid()}.tmp"
+        with open(temporaire, "wb") as fichier:
+            for symbole, (position, longueur) in self._index.items():
+                index[symbole] = (fichier.tell(), longueur)
+                fichier.write(contenu[position:position + longueur])
+        os.replace(temporaire, self.chemin)
+        self._index = index
+    
+    def ecrire(self, symbole: str, donnees: DonneesEntreprise, expiration: float) -> None:
+        """
+        Ajoute un enregistrement en fin de fichier et met à jour l'index
+        expiration: date à laquelle la première des données sources expire
+        """
+        import pickle
+        
+        enregistrement = pickle.dumps((symbole, expiration, astuple(donnees)), protocol=5)
+        with self.verrou:
+            try:
+                os.makedirs(os.path.dirname(self.chemin), exist_ok=True)
+                with open(self.chemin, "ab") as fichier:
+                    position = fichier.tell()
+                    fichier.write(enregistrement)
+                self._index[symbole] = (position, len(enregistrement))
+                
+                # Les enregistrements remplacés occupent plus de la moitié du fichier: compactage
+                taille_utile = sum(longueur for _, longueur in self._index.values())
+                if position + len(enregistrement) > 2 * taille_utile:
+                    self._compacter()
+                
+                temporaire = f"{self.chemin_index}.{os.getpid()}.tmp"
+                with open(temporaire, "wb") as fichier:
+                    pickle.dump(self._index, fichier, protocol=5)
+                os.replace(temporaire, self.chemin_index)
+            except OSError as e:
+                print(f"⚠️ Impossible d'écrire dans le cache: {e}")
+            
+            # Le fichier a grandi: la projection sera rouverte à la prochaine lecture
+            if self._vue is not None:
+                self._vue.close()
+                self._vue = None
+
+
+def avec_cache(fonction: str, ttl: float) -> Callable:
+    """
+    Décorateur pour les méthodes de RecuperateurDonneesAPI: consulte le cache disque
+    avant d'appeler l'API et enregistre les réponses valides.
+    Si l'appel échoue et que cache_fallback est actif, la dernière réponse connue
+    (même expirée) est renvoyée.
+    L'origine de chaque réponse renvoyée est notée dans self.provenance[fonction, parametre]
+    sous la forme (expiration, expirée).
+    """
+    def decorateur(methode: Callable) -> Callable:
+        @functools.wraps(methode)
+        def enveloppe(self, parametre: str):
+            entree = self.cache.lire(fonction, parametre)
+            if entree is not None and time.time() - entree["ts"] < ttl:
+                self.provenance[fonction, parametre] = (entree["ts"] + ttl, False)
+                return entree["data"]
+            
+            data = methode(self, parametre)
+            if data is not None:
+                self.provenance[fonction, parametre] = (self.cache.ecrire(fonction, parametre, data) + ttl, False)
+                return data
+            
+            if entree is not None and self.cache_fallback:
+                print(f"♻️ Utilisation des données en cache (expirées) pour {parametre}")
+                self.provenance[fonction, parametre] = (entree["ts"] + ttl, True)
+                return entree["data"]
+            return None
+        return enveloppe
+    return decorateur
+
+
 class RecuperateurDonneesAPI:
     """
     Classe pour récupérer les données financières via l'API Alpha Vantage
     """
     
-    def __init__(self, api_key: str = "demo"):
+    # Un limiteur par clé API, partagé entre les instances: la limite de débit s'applique
+    # à la clé, et un nouveau récupérateur est créé à chaque analyse
+    _limiteurs: Dict[str, LimiteurDebit] = {}
+    _verrou_limiteurs = threading.Lock()
+    
+    # Session HTTP commune à toutes les instances: son pool de connexions survit d'une analyse à l'autre
+    _session: Optional["requests.Session"] = None
+    _verrou_session = threading.Lock()
+    
+    @classmethod
+    def _session_partagee(cls) -> "requests.Session":
+        """
+        Retourne la session HTTP commune (créée au premier appel, fermée à la fin du programme)
+        """
+        with cls._verrou_session:
+            if cls._session is None:
+                # Import différé: requests (urllib3, ssl...) n'est chargé que si l'API est utilisée,
+                # l'analyse manuelle et les exemples démarrent donc sans ce coût
+                import requests
+                from requests.adapters import HTTPAdapter
+                
+                # Réutilise les connexions TCP/TLS entre les requêtes
+                cls._session = requests.Session()
+                cls._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+                atexit.register(cls._session.close)
+            return cls._session
+    
+    def __init__(self, api_key: str = "demo", cache_fallback: bool = True):
         """
         Initialise le récupérateur avec une clé API
         Utilisez 'demo' pour les tests, mais obtenez une vraie clé sur alphavantage.co
+        cache_fallback: réutiliser les données en cache expirées si l'API ne répond pas
         """
         self.api_key = api_key
         self.base_url = "https://www.alphavantage.co/query"
+        self.cache = CacheFichier()
+        self.cache_entreprises = CacheCompact.partage()
+        self.cache_fallback = cache_fallback
+        # Origine des réponses (expiration, expirée) par (fonction, paramètre), tenue par avec_cache
+        self.provenance: Dict[Tuple[str, str], Tuple[float, bool]] = {}
         
-        # Mapping des secteurs en anglais vers français
-        self.secteurs_mapping = {
-            "TECHNOLOGY": "technologie",
-            "FINANCIAL SERVICES": "finance",
-            "HEALTHCARE": "sante",
-            "INDUSTRIALS": "industrie",
-            "CONSUMER DISCRETIONARY": "consommation",
-            "CONSUMER STAPLES": "consommation",
-            "ENERGY": "energie",
-            "UTILITIES": "energie",
-            "MATERIALS": "industrie",
-            "REAL ESTATE": "finance",
-            "COMMUNICATION SERVICES": "technologie"
-        }
+        # Import différé, comme requests: fastnumbers (qui importe NumPy) n'est chargé que si l'API est utilisée
+        try:
+            from fastnumbers import fast_float as vers_float  # Conversion texte -> float en C
+        except ImportError:
+            vers_float = _float_ou_defaut
+        self._vers_float = vers_float
+        
+        self.session = self._session_partagee()
+        
+        # Limite du plan gratuit: 5 requêtes/minute
+        with self._verrou_limiteurs:
+            limiteur = self._limiteurs.get(api_key)
+            if limiteur is None:
+                limiteur = self._limiteurs[api_key] = LimiteurDebit(5, 60)
+        self.limiteur = limiteur
+    
+    def _requete_brute(self, params: Dict[str, str]) -> bytes:
+        """
+        Envoie une requête à l'API en respectant la limite de débit et renvoie le corps brut
+        """
+        self.limiteur.acquerir()
+        response = self.session.get(self.base_url, params=params, timeout=10)
+        return response.content
+    
+    def _requete_api(self, params: Dict[str, str]) -> Dict:
+        """
+        Envoie une requête à l'API et décode la réponse JSON complète
+        """
+        return _charger_json(self._requete_brute(params))
     
+    @staticmethod
+    def _extraire_rapports(contenu: bytes, motif: "re.Pattern[bytes]", champs: Tuple[str, ...],
+                           nb_rapports: int) -> Dict:
+        """
+        Ne garde que les premiers rapports annuels et les champs utiles de chacun
+        Les rapports annuels précèdent les trimestriels et commencent tous par fiscalDateEnding
+        """
+        annuels = contenu.split(b'"quarterlyReports"', 1)[0]
+        segments = annuels.split(b'"fiscalDateEnding"')
+        rapports = segments[1:nb_rapports + 1]
+        # fiscalDateEnding doit suivre directement l'accolade ouvrante de chaque rapport retenu,
+        # ainsi que du suivant: sinon des champs d'un exercice tomberaient dans le segment d'un autre
+        ordre_attendu = all(segments[i].rstrip().endswith(b"{")
+                            for i in range(min(nb_rapports + 1, len(segments) - 1)))
+        if not rapports or not ordre_attendu:  # Format inattendu: décodage complet
+            rapports_json = _charger_json(contenu)["annualReports"][:nb_rapports]
+            return {"annualReports": [{champ: r.get(champ, "None") for champ in champs} for r in rapports_json]}
+        
+        extraits = [_extraire_champs(motif, rapport) for rapport in rapports]
+        return {"annualReports": [{champ: r.get(champ, "None") for champ in champs} for r in extraits]}
+    
+    @avec_cache("SYMBOL_SEARCH", ttl=TTL_RECHERCHE)
     def rechercher_symbole(self, nom_entreprise: str) -> Optional[str]:
         """
         Recherche le symbole boursier d'une entreprise à partir de son nom
@@ -65,8 +551,7 @@ class RecuperateurDonneesAPI:
         }
         
         try:
-            response = requests.get(self.base_url, params=params, timeout=10)
-            data = response.json()
+            data = self._requete_api(params)
             
             if "bestMatches" in data and len(data["bestMatches"]) > 0:
                 # Prendre le premier résultat (le plus pertinent)
@@ -83,6 +568,7 @@ class RecuperateurDonneesAPI:
             print(f"❌ Erreur lors de la recherche: {e}")
             return None
     
+    @avec_cache("OVERVIEW", ttl=TTL_APERCU)
     def obtenir_apercu_entreprise(self, symbole: str) -> Optional[Dict]:
         """
         Récupère les informations générales de l'entreprise
@@ -94,8 +580,8 @@ class RecuperateurDonneesAPI:
         }
         
         try:
-            response = requests.get(self.base_url, params=params, timeout=10)
-            data = response.json()
+            # Schéma fixe: lecture directe des champs utiles, sans décodage JSON complet
+            data = _extraire_champs(_MOTIF_APERCU, self._requete_brute(params))
             
             if "Symbol" in data:
                 return data
@@ -107,6 +593,7 @@ class RecuperateurDonneesAPI:
             print(f"❌ Erreur lors de la récupération de l'aperçu: {e}")
             return None
     
+    @avec_cache("INCOME_STATEMENT", ttl=TTL_ETATS_FINANCIERS)
     def obtenir_revenus_annuels(self, symbole: str) -> Optional[Dict]:
         """
         Récupère les revenus annuels de l'entreprise
@@ -118,11 +605,11 @@ class RecuperateurDonneesAPI:
         }
         
         try:
-            response = requests.get(self.base_url, params=params, timeout=10)
-            data = response.json()
+            contenu = self._requete_brute(params)
             
-            if "annualReports" in data:
-                return data
+            if b'"annualReports"' in contenu:
+                # Les deux derniers exercices suffisent pour la croissance des revenus
+                return self._extraire_rapports(contenu, _MOTIF_REVENUS, CHAMPS_REVENUS, 2)
             else:
                 print(f"⚠️ Données de revenus non disponibles pour {symbole}")
                 return None
@@ -131,6 +618,7 @@ class RecuperateurDonneesAPI:
             print(f"❌ Erreur lors de la récupération des revenus: {e}")
             return None
     
+    @avec_cache("BALANCE_SHEET", ttl=TTL_ETATS_FINANCIERS)
     def obtenir_bilan(self, symbole: str) -> Optional[Dict]:
         """
         Récupère le bilan de l'entreprise
@@ -142,11 +630,10 @@ class RecuperateurDonneesAPI:
         }
         
         try:
-            response = requests.get(self.base_url, params=params, timeout=10)
-            data = response.json()
+            contenu = self._requete_brute(params)
             
-            if "annualReports" in data:
-                return data
+            if b'"annualReports"' in contenu:
+                return self._extraire_rapports(contenu, _MOTIF_BILAN, CHAMPS_BILAN, 1)
             else:
                 print(f"⚠️ Données de bilan non disponibles pour {symbole}")
                 return None
@@ -159,19 +646,15 @@ class RecuperateurDonneesAPI:
         """
         Convertit une chaîne de caractères en float, gère 'None' et les valeurs vides
         """
-        if not valeur_str or valeur_str == "None" or valeur_str == "-":
-            return 0.0
-        try:
-            return float(valeur_str)
-        except:
+        if valeur_str is None or valeur_str in _VALEURS_VIDES:
             return 0.0
+        return self._vers_float(valeur_str, default=0.0)
     
     def detecter_secteur(self, secteur_api: str) -> str:
         """
         Convertit le secteur de l'API en secteur français
         """
-        secteur_upper = secteur_api.upper()
-        return self.secteurs_mapping.get(secteur_upper, "defaut")
+        return _secteur_francais(secteur_api)
     
     def recuperer_donnees_entreprise(self, nom_entreprise: str) -> Optional[DonneesEntreprise]:
         """
@@ -185,24 +668,30 @@ class RecuperateurDonneesAPI:
         if not symbole:
             return None
         
+        # Données déjà assemblées récemment: aucune requête nécessaire
+        donnees = self.cache_entreprises.lire(symbole)
+        if donnees is not None:
+            print("✅ Données récupérées depuis le cache!")
+            return donnees
+        
         print("⏳ Récupération des données financières...")
         
         # 2. Récupérer l'aperçu général (ratios principaux)
+        # En premier: en cas d'échec (symbole inconnu, limite atteinte), les deux autres
+        # requêtes ne consomment pas inutilement le quota de l'API
         apercu = self.obtenir_apercu_entreprise(symbole)
         if not apercu:
             return None
         
-        # Petite pause pour éviter de surcharger l'API
-        time.sleep(1)
-        
-        # 3. Récupérer les revenus
-        revenus_data = self.obtenir_revenus_annuels(symbole)
+        # 3-4. Revenus et bilan sont indépendants: récupération en parallèle
+        from concurrent.futures import ThreadPoolExecutor
         
-        # Petite pause pour éviter de surcharger l'API
-        time.sleep(1)
-        
-        # 4. Récupérer le bilan
-        bilan_data = self.obtenir_bilan(symbole)
+        with ThreadPoolExecutor(max_workers=2) as executeur:
+            futur_revenus = executeur.submit(self.obtenir_revenus_annuels, symbole)
+            futur_bilan = executeur.submit(self.obtenir_bilan, symbole)
+            
+            revenus_data = futur_revenus.result()
+            bilan_data = futur_bilan.result()
         
         try:
             # Extraction des données de l'aperçu
@@ -230,20 +719,19 @@ class RecuperateurDonneesAPI:
             revenus_annee_precedente = 0
             
             if revenus_data and "annualReports" in revenus_data and len(revenus_data["annualReports"]) >= 2:
-                revenus_actuels = self.convertir_valeur(revenus_data["annualReports"][0].get("totalRevenue", "0")) / 1_000_000
-                revenus_annee_precedente = self.convertir_valeur(revenus_data["annualReports"][1].get("totalRevenue", "0")) / 1_000_000
+                rapport_actuel, rapport_precedent = revenus_data["annualReports"][:2]
+                revenus_actuels = self.convertir_valeur(_LIRE_REVENUS(rapport_actuel)) / 1_000_000
+                revenus_annee_precedente = self.convertir_valeur(_LIRE_REVENUS(rapport_precedent)) / 1_000_000
             
             # Extraction du bilan
             dette_totale = 0
             capitaux_propres = 0
             
             if bilan_data and "annualReports" in bilan_data and len(bilan_data["annualReports"]) >= 1:
-                dernier_bilan = bilan_data["annualReports"][0]
-                dette_totale = self.convertir_valeur(dernier_bilan.get("totalDebt", "0")) / 1_000_000
-                if dette_totale == 0:  # Fallback
-                    dette_totale = self.convertir_valeur(dernier_bilan.get("longTermDebt", "0")) / 1_000_000
-                
-                capitaux_propres = self.convertir_valeur(dernier_bilan.get("totalShareholderEquity", "0")) / 1_000_000
+                dette, dette_long_terme, fonds_propres = _LIRE_BILAN(bilan_data["annualReports"][0])
+                # La dette long terme sert de repli si la dette totale n'est pas renseignée
+                dette_totale = (self.convertir_valeur(dette) or self.convertir_valeur(dette_long_terme)) / 1_000_000
+                capitaux_propres = self.convertir_valeur(fonds_propres) / 1_000_000
             
             # Validation des données essentielles
             if benefice_par_action <= 0:
@@ -253,7 +741,7 @@ class RecuperateurDonneesAPI:
             
             print("✅ Données récupérées avec succès!")
             
-            return DonneesEntreprise(
+            donnees = DonneesEntreprise(
                 nom=nom,
                 symbole=symbole,
                 prix_action=prix_action,
@@ -268,45 +756,252 @@ class RecuperateurDonneesAPI:
                 capitalisation_boursiere=capitalisation_boursiere
             )
             
+            # Mise en cache seulement si les trois réponses sont présentes et aucune n'est un repli
+            # expiré; l'enregistrement expire avec la première d'entre elles pour ne pas leur survivre
+            if revenus_data is not None and bilan_data is not None:
+                sources = [self.provenance[fonction, symbole]
+                           for fonction in ("OVERVIEW", "INCOME_STATEMENT", "BALANCE_SHEET")]
+                if not any(expiree for _, expiree in sources):
+                    self.cache_entreprises.ecrire(symbole, donnees, min(expiration for expiration, _ in sources))
+            return donnees
+            
         except Exception as e:
             print(f"❌ Erreur lors du traitement des données: {e}")
             return None
 
 
+@functools.lru_cache(maxsize=1)
+def _noyau_numba() -> Optional[Callable]:
+    """
+    Compile (au premier appel) le noyau de notation de portefeuille avec Numba
+    Retourne None si Numba n'est pas installé: l'analyse utilise alors NumPy
+    La compilation est mise en cache sur disque (cache=True) pour les exécutions suivantes
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+    import numpy as np
+    
+    @njit(cache=True)
+    def palier(seuils, valeur):
+        # Équivalent de bisect_right: nombre de seuils inférieurs ou égaux à la valeur
+        i = 0
+        while i < seuils.shape[0] and not (valeur < seuils[i]):
+            i += 1
+        return i
+    
+    @njit(cache=True)
+    def palier_relatif(seuils, reference, valeur):
+        # Idem avec des seuils exprimés en multiples de la référence (comparaison valeur < reference * seuil)
+        i = 0
+        while i < seuils.shape[0] and not (valeur < reference * seuils[i]):
+            i += 1
+        return i
+    
+    # Pas de fastmath: les ratios non calculables sont représentés par inf
+    @njit(parallel=True, cache=True)
+    def noter_portefeuille(prix, eps, bvps, revenus_actuels, revenus_precedents, dette,
+                           capitaux_propres, croissance_prevue, secteur_id, table_secteurs,
+                           seuils_pe, notes_pe, seuils_pb, notes_pb, seuils_peg, notes_peg,
+                           notes_croissance, seuils_endettement, notes_endettement,
+                           seuils_conclusion, poids):
+        n = prix.shape[0]
+        inf = np.inf
+        pe_ratio = np.empty(n)
+        pb_ratio = np.empty(n)
+        peg_ratio = np.empty(n)
+        croissance_revenus = np.empty(n)
+        ratio_endettement = np.empty(n)
+        score_pe = np.empty(n, dtype=np.int64)
+        score_pb = np.empty(n, dtype=np.int64)
+        score_peg = np.empty(n, dtype=np.int64)
+        score_croissance = np.empty(n, dtype=np.int64)
+        score_endettement = np.empty(n, dtype=np.int64)
+        score_final = np.empty(n)
+        paliers = np.empty(n, dtype=np.int64)
+        
+        for i in prange(n):
+            secteur = secteur_id[i]
+            pe_ref = table_secteurs[secteur, 0]
+            pb_ref = table_secteurs[secteur, 1]
+            croissance_ref = table_secteurs[secteur, 2]
+            
+            # Ratios
+            pe = prix[i] / eps[i] if eps[i] > 0 else inf
+            pb = prix[i] / bvps[i] if bvps[i] > 0 else inf
+            peg = pe / croissance_prevue[i] if eps[i] > 0 and croissance_prevue[i] > 0 else inf
+            if revenus_precedents[i] > 0:
+                croissance = ((revenus_actuels[i] - revenus_precedents[i]) / revenus_precedents[i]) * 100
+            else:
+                croissance = 0.0
+            endettement = dette[i] / capitaux_propres[i] if capitaux_propres[i] > 0 else inf
+            
+            # Scores
+            s_pe = 0 if pe == inf else notes_pe[palier_relatif(seuils_pe, pe_ref, pe)]
+            s_pb = notes_pb[palier_relatif(seuils_pb, pb_ref, pb)]
+            s_peg = 20 if peg == inf else notes_peg[palier(seuils_peg, peg)]
+            s_croissance = notes_croissance[(croissance > 0) + (croissance > croissance_ref) +
+                                            (croissance > croissance_ref * 1.5)]
+            s_endettement = 0 if endettement == inf else notes_endettement[palier(seuils_endettement, endettement)]
+            
+            final = (s_pe * poids[0] + s_pb * poids[1] + s_peg * poids[2] +
+                     s_croissance * poids[3] + s_endettement * poids[4])
+            
+            pe_ratio[i] = pe
+            pb_ratio[i] = pb
+            peg_ratio[i] = peg
+            croissance_revenus[i] = croissance
+            ratio_endettement[i] = endettement
+            score_pe[i] = s_pe
+            score_pb[i] = s_pb
+            score_peg[i] = s_peg
+            score_croissance[i] = s_croissance
+            score_endettement[i] = s_endettement
+            score_final[i] = final
+            paliers[i] = palier(seuils_conclusion, final)
+        
+        return (pe_ratio, pb_ratio, peg_ratio, croissance_revenus, ratio_endettement,
+                score_pe, score_pb, score_peg, score_croissance, score_endettement,
+                score_final, paliers)
+    
+    return noter_portefeuille
+
+
 class AnalyseurSousEvaluation:
     """
     Classe principale pour analyser si une entreprise est sous-évaluée
     """
     
+    # Barèmes de notation: seuils croissants et (score, explication) pour chaque palier
+    # Les seuils P/E et P/B sont des multiples de la moyenne du secteur
+    _SEUILS_PE = (0.7, 0.85, 1.15, 1.5)
+    _PALIERS_PE = (
+        (90, "P/E très faible ({:.1f} vs {:.1f}) - potentiellement sous-évaluée"),  # 30% sous la moyenne
+        (70, "P/E faible ({:.1f} vs {:.1f}) - possiblement sous-évaluée"),  # 15% sous la moyenne
+        (50, "P/E normal ({:.1f} vs {:.1f}) - valorisation équitable"),  # Dans la normale
+        (30, "P/E élevé ({:.1f} vs {:.1f}) - possiblement surévaluée"),  # Élevé
+        (10, "P/E très élevé ({:.1f} vs {:.1f}) - probablement surévaluée")
+    )
+    
+    _SEUILS_PB = (0.6, 0.8, 1.2)
+    _PALIERS_PB = (
+        (85, "P/B très faible ({:.1f} vs {:.1f}) - forte sous-évaluation possible"),
+        (65, "P/B faible ({:.1f} vs {:.1f}) - sous-évaluation possible"),
+        (50, "P/B normal ({:.1f} vs {:.1f}) - valorisation équitable"),
+        (25, "P/B élevé ({:.1f} vs {:.1f}) - possiblement surévaluée")
+    )
+    
+    _SEUILS_PEG = (0.5, 1.0, 1.5, 2.0)
+    _PALIERS_PEG = (
+        (95, "PEG excellent ({:.2f}) - très sous-évaluée"),
+        (80, "PEG bon ({:.2f}) - sous-évaluée"),
+        (50, "PEG acceptable ({:.2f}) - valorisation équitable"),
+        (30, "PEG élevé ({:.2f}) - possiblement surévaluée"),
+        (10, "PEG très élevé ({:.2f}) - probablement surévaluée")
+    )
+    
+    # Croissance: seuils 0, moyenne et 1.5 × moyenne du secteur (bornes exclues)
+    _PALIERS_CROISSANCE = (
+        (20, "Croissance négative ({:.1f}%) - préoccupant"),
+        (45, "Croissance modérée ({:.1f}% vs {:.1f}%)"),
+        (65, "Bonne croissance ({:.1f}% vs {:.1f}%)"),
+        (80, "Excellente croissance ({:.1f}% vs {:.1f}%)")
+    )
+    
+    _SEUILS_ENDETTEMENT = (0.3, 0.6, 1.0)
+    _PALIERS_ENDETTEMENT = (
+        (80, "Endettement faible ({:.2f}) - situation financière saine"),
+        (60, "Endettement modéré ({:.2f}) - situation acceptable"),
+        (40, "Endettement élevé ({:.2f}) - surveillance nécessaire"),
+        (20, "Endettement très élevé ({:.2f}) - risque important")
+    )
+    
+    # Pondération du score final: les poids reflètent l'importance relative de chaque métrique
+    _POIDS = {
+        "pe": 0.25,      # 25% - Très important pour la valorisation
+        "pb": 0.20,      # 20% - Important pour la valeur intrinsèque
+        "peg": 0.25,     # 25% - Très important (combine P/E et croissance)
+        "croissance": 0.20,  # 20% - Important pour le potentiel futur
+        "endettement": 0.10  # 10% - Important pour la stabilité
+    }
+    
+    # Conclusion selon le score final (bornes incluses)
+    _SEUILS_CONCLUSION = (25, 40, 60, 75)
+    _CONCLUSIONS = (
+        ("SURÉVALUÉE ❌", "Vente recommandée"),
+        ("POSSIBLEMENT SURÉVALUÉE ⚠️", "Éviter ou vendre"),
+        ("VALORISATION ÉQUITABLE ⚖️", "Tenir ou analyser davantage"),
+        ("SOUS-ÉVALUÉE ✅", "Achat recommandé"),
+        ("FORTEMENT SOUS-ÉVALUÉE 🚀", "Achat fortement recommandé")
+    )
+    
+    # Tableaux NumPy de l'analyse de portefeuille, construits au premier besoin (_tables_numpy)
+    _TABLES_NUMPY: Optional[Dict[str, "np.ndarray"]] = None
+    
     def __init__(self):
-        # Valeurs de référence moyennes par secteur (exemples réalistes)
-        self.references_secteur = {
-            "technologie": {"pe_moyen": 25, "pb_moyen": 4.5, "croissance_moyenne": 15},
-            "finance": {"pe_moyen": 12, "pb_moyen": 1.2, "croissance_moyenne": 8},
-            "sante": {"pe_moyen": 18, "pb_moyen": 3.0, "croissance_moyenne": 12},
-            "industrie": {"pe_moyen": 16, "pb_moyen": 2.5, "croissance_moyenne": 6},
-            "consommation": {"pe_moyen": 20, "pb_moyen": 3.5, "croissance_moyenne": 10},
-            "energie": {"pe_moyen": 14, "pb_moyen": 1.8, "croissance_moyenne": 5},
-            "defaut": {"pe_moyen": 18, "pb_moyen": 2.8, "croissance_moyenne": 10}
-        }
+        # Indice de chaque secteur dans la table des références de l'analyse de portefeuille
+        self.index_secteurs = {secteur: i for i, secteur in enumerate(REFERENCES_SECTEUR)}
+    
+    @classmethod
+    def _tables_numpy(cls) -> Dict[str, "np.ndarray"]:
+        """
+        Scores des paliers et références des secteurs sous forme de tableaux NumPy
+        NumPy n'est importé qu'ici: l'analyse d'une seule entreprise n'en dépend pas
+        """
+        if cls._TABLES_NUMPY is None:
+            import numpy as np
+            cls._TABLES_NUMPY = {
+                "notes_pe": np.array([score for score, _ in cls._PALIERS_PE]),
+                "notes_pb": np.array([score for score, _ in cls._PALIERS_PB]),
+                "notes_peg": np.array([score for score, _ in cls._PALIERS_PEG]),
+                "notes_croissance": np.array([score for score, _ in cls._PALIERS_CROISSANCE]),
+                "notes_endettement": np.array([score for score, _ in cls._PALIERS_ENDETTEMENT]),
+                # Colonnes: pe_moyen, pb_moyen, croissance_moyenne (lignes dans l'ordre de index_secteurs)
+                "secteurs": np.array([
+                    (ref.pe_moyen, ref.pb_moyen, ref.croissance_moyenne)
+                    for ref in REFERENCES_SECTEUR.values()
+                ], dtype=np.float64)
+            }
+        return cls._TABLES_NUMPY
+        
+    def _calculer_ratios(self, donnees: DonneesEntreprise) -> Tuple[float, float, float, float, float]:
+        """
+        Calcule en une passe les cinq ratios (P/E, P/B, PEG, croissance des revenus, endettement)
+        Chaque champ n'est lu qu'une fois et le P/E est réutilisé pour le PEG
+        """
+        prix = donnees.prix_action
+        eps = donnees.benefice_par_action
+        valeur_comptable = donnees.valeur_comptable_par_action
+        croissance_prevue = donnees.croissance_benefices_prevue
+        revenus_precedents = donnees.revenus_annee_precedente
+        capitaux_propres = donnees.capitaux_propres
+        inf = float('inf')
+        
+        pe_ratio = prix / eps if eps > 0 else inf
+        pb_ratio = prix / valeur_comptable if valeur_comptable > 0 else inf
+        peg_ratio = pe_ratio / croissance_prevue if eps > 0 and croissance_prevue > 0 else inf
+        if revenus_precedents > 0:
+            croissance_revenus = ((donnees.revenus_actuels - revenus_precedents) / revenus_precedents) * 100
+        else:
+            croissance_revenus = 0
+        ratio_endettement = donnees.dette_totale / capitaux_propres if capitaux_propres > 0 else inf
         
+        return pe_ratio, pb_ratio, peg_ratio, croissance_revenus, ratio_endettement
+    
     def calculer_ratio_pe(self, donnees: DonneesEntreprise) -> float:
         """
         Calcule le ratio Price-to-Earnings (P/E)
         P/E = Prix de l'action / Bénéfice par action
         """
-        if donnees.benefice_par_action <= 0:
-            return float('inf')
-        return donnees.prix_action / donnees.benefice_par_action
+        return self._calculer_ratios(donnees)[0]
     
     def calculer_ratio_pb(self, donnees: DonneesEntreprise) -> float:
         """
         Calcule le ratio Price-to-Book (P/B)
         P/B = Prix de l'action / Valeur comptable par action
         """
-        if donnees.valeur_comptable_par_action <= 0:
-            return float('inf')
-        return donnees.prix_action / donnees.valeur_comptable_par_action
+        return self._calculer_ratios(donnees)[1]
     
     def calculer_ratio_peg(self, donnees: DonneesEntreprise) -> float:
         """
@@ -314,153 +1009,102 @@ class AnalyseurSousEvaluation:
         PEG = P/E / Taux de croissance des bénéfices
         Un PEG < 1 indique généralement une sous-évaluation
         """
-        pe_ratio = self.calculer_ratio_pe(donnees)
-        if pe_ratio == float('inf') or donnees.croissance_benefices_prevue <= 0:
-            return float('inf')
-        return pe_ratio / donnees.croissance_benefices_prevue
+        return self._calculer_ratios(donnees)[2]
     
     def calculer_croissance_revenus(self, donnees: DonneesEntreprise) -> float:
         """
         Calcule le taux de croissance des revenus (en pourcentage)
         """
-        if donnees.revenus_annee_precedente <= 0:
-            return 0
-        return ((donnees.revenus_actuels - donnees.revenus_annee_precedente) / 
-                donnees.revenus_annee_precedente) * 100
+        return self._calculer_ratios(donnees)[3]
     
     def calculer_ratio_endettement(self, donnees: DonneesEntreprise) -> float:
         """
         Calcule le ratio d'endettement
         Ratio = Dette totale / Capitaux propres
         """
-        if donnees.capitaux_propres <= 0:
-            return float('inf')
-        return donnees.dette_totale / donnees.capitaux_propres
+        return self._calculer_ratios(donnees)[4]
     
-    def obtenir_references(self, secteur: str) -> Dict[str, float]:
+    def obtenir_references(self, secteur: str) -> ReferencesSecteur:
         """
         Obtient les valeurs de référence pour un secteur donné
+        Le secteur est attendu en minuscules (detecter_secteur et la saisie manuelle le normalisent)
         """
-        secteur_key = secteur.lower()
-        return self.references_secteur.get(secteur_key, self.references_secteur["defaut"])
+        return _references_secteur(secteur)
     
-    def evaluer_ratio_pe(self, pe_ratio: float, references: Dict[str, float]) -> Tuple[int, str]:
+    def evaluer_ratio_pe(self, pe_ratio: float, references: ReferencesSecteur,
+                         verbose: bool = True) -> Tuple[int, str]:
         """
         Évalue le ratio P/E par rapport aux références du secteur
-        Retourne un score (0-100) et une explication
+        Retourne un score (0-100) et une explication (vide si verbose=False)
         """
-        pe_reference = references["pe_moyen"]
-        
         if pe_ratio == float('inf'):
-            return 0, "P/E infini (pas de bénéfices) - très risqué"
-        
-        if pe_ratio < pe_reference * 0.7:  # 30% sous la moyenne
-            return 90, f"P/E très faible ({pe_ratio:.1f} vs {pe_reference:.1f}) - potentiellement sous-évaluée"
-        elif pe_ratio < pe_reference * 0.85:  # 15% sous la moyenne
-            return 70, f"P/E faible ({pe_ratio:.1f} vs {pe_reference:.1f}) - possiblement sous-évaluée"
-        elif pe_ratio < pe_reference * 1.15:  # Dans la normale
-            return 50, f"P/E normal ({pe_ratio:.1f} vs {pe_reference:.1f}) - valorisation équitable"
-        elif pe_ratio < pe_reference * 1.5:  # Élevé
-            return 30, f"P/E élevé ({pe_ratio:.1f} vs {pe_reference:.1f}) - possiblement surévaluée"
-        else:
-            return 10, f"P/E très élevé ({pe_ratio:.1f} vs {pe_reference:.1f}) - probablement surévaluée"
+            return 0, "P/E infini (pas de bénéfices) - très risqué" if verbose else ""
+        
+        pe_reference = references.pe_moyen
+        seuils = tuple(pe_reference * seuil for seuil in self._SEUILS_PE)
+        score, explication = self._PALIERS_PE[bisect_right(seuils, pe_ratio)]
+        return score, explication.format(pe_ratio, pe_reference) if verbose else ""
     
-    def evaluer_ratio_pb(self, pb_ratio: float, references: Dict[str, float]) -> Tuple[int, str]:
+    def evaluer_ratio_pb(self, pb_ratio: float, references: ReferencesSecteur,
+                         verbose: bool = True) -> Tuple[int, str]:
         """
         Évalue le ratio P/B par rapport aux références du secteur
         """
-        pb_reference = references["pb_moyen"]
-        
-        if pb_ratio < pb_reference * 0.6:
-            return 85, f"P/B très faible ({pb_ratio:.1f} vs {pb_reference:.1f}) - forte sous-évaluation possible"
-        elif pb_ratio < pb_reference * 0.8:
-            return 65, f"P/B faible ({pb_ratio:.1f} vs {pb_reference:.1f}) - sous-évaluation possible"
-        elif pb_ratio < pb_reference * 1.2:
-            return 50, f"P/B normal ({pb_ratio:.1f} vs {pb_reference:.1f}) - valorisation équitable"
-        else:
-            return 25, f"P/B élevé ({pb_ratio:.1f} vs {pb_reference:.1f}) - possiblement surévaluée"
+        pb_reference = references.pb_moyen
+        seuils = tuple(pb_reference * seuil for seuil in self._SEUILS_PB)
+        score, explication = self._PALIERS_PB[bisect_right(seuils, pb_ratio)]
+        return score, explication.format(pb_ratio, pb_reference) if verbose else ""
     
-    def evaluer_ratio_peg(self, peg_ratio: float) -> Tuple[int, str]:
+    def evaluer_ratio_peg(self, peg_ratio: float, verbose: bool = True) -> Tuple[int, str]:
         """
         Évalue le ratio PEG (indépendant du secteur)
         """
         if peg_ratio == float('inf'):
-            return 20, "PEG non calculable - croissance ou bénéfices insuffisants"
-        elif peg_ratio < 0.5:
-            return 95, f"PEG excellent ({peg_ratio:.2f}) - très sous-évaluée"
-        elif peg_ratio < 1.0:
-            return 80, f"PEG bon ({peg_ratio:.2f}) - sous-évaluée"
-        elif peg_ratio < 1.5:
-            return 50, f"PEG acceptable ({peg_ratio:.2f}) - valorisation équitable"
-        elif peg_ratio < 2.0:
-            return 30, f"PEG élevé ({peg_ratio:.2f}) - possiblement surévaluée"
-        else:
-            return 10, f"PEG très élevé ({peg_ratio:.2f}) - probablement surévaluée"
+            return 20, "PEG non calculable - croissance ou bénéfices insuffisants" if verbose else ""
+        
+        score, explication = self._PALIERS_PEG[bisect_right(self._SEUILS_PEG, peg_ratio)]
+        return score, explication.format(peg_ratio) if verbose else ""
     
-    def evaluer_croissance(self, croissance_revenus: float, references: Dict[str, float]) -> Tuple[int, str]:
+    def evaluer_croissance(self, croissance_revenus: float, references: ReferencesSecteur,
+                           verbose: bool = True) -> Tuple[int, str]:
         """
         Évalue la croissance des revenus
         """
-        croissance_ref = references["croissance_moyenne"]
-        
-        if croissance_revenus > croissance_ref * 1.5:
-            return 80, f"Excellente croissance ({croissance_revenus:.1f}% vs {croissance_ref:.1f}%)"
-        elif croissance_revenus > croissance_ref:
-            return 65, f"Bonne croissance ({croissance_revenus:.1f}% vs {croissance_ref:.1f}%)"
-        elif croissance_revenus > 0:
-            return 45, f"Croissance modérée ({croissance_revenus:.1f}% vs {croissance_ref:.1f}%)"
-        else:
-            return 20, f"Croissance négative ({croissance_revenus:.1f}%) - préoccupant"
+        croissance_ref = references.croissance_moyenne
+        seuils = (0, croissance_ref, croissance_ref * 1.5)
+        score, explication = self._PALIERS_CROISSANCE[bisect_left(seuils, croissance_revenus)]
+        return score, explication.format(croissance_revenus, croissance_ref) if verbose else ""
     
-    def evaluer_endettement(self, ratio_endettement: float) -> Tuple[int, str]:
+    def evaluer_endettement(self, ratio_endettement: float, verbose: bool = True) -> Tuple[int, str]:
         """
         Évalue le niveau d'endettement
         """
         if ratio_endettement == float('inf'):
-            return 0, "Endettement critique - capitaux propres négatifs"
-        elif ratio_endettement < 0.3:
-            return 80, f"Endettement faible ({ratio_endettement:.2f}) - situation financière saine"
-        elif ratio_endettement < 0.6:
-            return 60, f"Endettement modéré ({ratio_endettement:.2f}) - situation acceptable"
-        elif ratio_endettement < 1.0:
-            return 40, f"Endettement élevé ({ratio_endettement:.2f}) - surveillance nécessaire"
-        else:
-            return 20, f"Endettement très élevé ({ratio_endettement:.2f}) - risque important"
+            return 0, "Endettement critique - capitaux propres négatifs" if verbose else ""
+        
+        score, explication = self._PALIERS_ENDETTEMENT[bisect_right(self._SEUILS_ENDETTEMENT, ratio_endettement)]
+        return score, explication.format(ratio_endettement) if verbose else ""
     
-    def analyser_entreprise(self, donnees: DonneesEntreprise) -> Dict:
+    def analyser_entreprise(self, donnees: DonneesEntreprise, verbose: bool = True) -> Dict:
         """
         Analyse complète d'une entreprise pour déterminer si elle est sous-évaluée
+        verbose=False: aucun affichage ni explication, seul le résultat est retourné
         """
-        print(f"\n🔍 ANALYSE DE {donnees.nom.upper()}")
-        print("=" * 50)
-        
         # Calcul des ratios
-        pe_ratio = self.calculer_ratio_pe(donnees)
-        pb_ratio = self.calculer_ratio_pb(donnees)
-        peg_ratio = self.calculer_ratio_peg(donnees)
-        croissance_revenus = self.calculer_croissance_revenus(donnees)
-        ratio_endettement = self.calculer_ratio_endettement(donnees)
+        pe_ratio, pb_ratio, peg_ratio, croissance_revenus, ratio_endettement = self._calculer_ratios(donnees)
         
         # Obtenir les références du secteur
         references = self.obtenir_references(donnees.secteur)
         
         # Évaluation de chaque métrique
-        score_pe, explication_pe = self.evaluer_ratio_pe(pe_ratio, references)
-        score_pb, explication_pb = self.evaluer_ratio_pb(pb_ratio, references)
-        score_peg, explication_peg = self.evaluer_ratio_peg(peg_ratio)
-        score_croissance, explication_croissance = self.evaluer_croissance(croissance_revenus, references)
-        score_endettement, explication_endettement = self.evaluer_endettement(ratio_endettement)
+        score_pe, explication_pe = self.evaluer_ratio_pe(pe_ratio, references, verbose)
+        score_pb, explication_pb = self.evaluer_ratio_pb(pb_ratio, references, verbose)
+        score_peg, explication_peg = self.evaluer_ratio_peg(peg_ratio, verbose)
+        score_croissance, explication_croissance = self.evaluer_croissance(croissance_revenus, references, verbose)
+        score_endettement, explication_endettement = self.evaluer_endettement(ratio_endettement, verbose)
         
         # Calcul du score final pondéré
-        # Les poids reflètent l'importance relative de chaque métrique
-        poids = {
-            "pe": 0.25,      # 25% - Très important pour la valorisation
-            "pb": 0.20,      # 20% - Important pour la valeur intrinsèque
-            "peg": 0.25,     # 25% - Très important (combine P/E et croissance)
-            "croissance": 0.20,  # 20% - Important pour le potentiel futur
-            "endettement": 0.10  # 10% - Important pour la stabilité
-        }
-        
+        poids = self._POIDS
         score_final = (
             score_pe * poids["pe"] +
             score_pb * poids["pb"] +
@@ -470,45 +1114,98 @@ class AnalyseurSousEvaluation:
         )
         
         # Détermination de la conclusion
-        if score_final >= 75:
-            conclusion = "FORTEMENT SOUS-ÉVALUÉE 🚀"
-            recommandation = "Achat fortement recommandé"
-        elif score_final >= 60:
-            conclusion = "SOUS-ÉVALUÉE ✅"
-            recommandation = "Achat recommandé"
-        elif score_final >= 40:
-            conclusion = "VALORISATION ÉQUITABLE ⚖️"
-            recommandation = "Tenir ou analyser davantage"
-        elif score_final >= 25:
-            conclusion = "POSSIBLEMENT SURÉVALUÉE ⚠️"
-            recommandation = "Éviter ou vendre"
-        else:
-            conclusion = "SURÉVALUÉE ❌"
-            recommandation = "Vente recommandée"
+        conclusion, recommandation = self._CONCLUSIONS[bisect_right(self._SEUILS_CONCLUSION, score_final)]
+        
+        resultat = {
+            "entreprise": donnees.nom,
+            "secteur": donnees.secteur,
+            "ratios": {
+                "pe": pe_ratio,
+                "pb": pb_ratio,
+                "peg": peg_ratio,
+                "croissance_revenus": croissance_revenus,
+                "ratio_endettement": ratio_endettement
+            },
+            "scores": {
+                "pe": score_pe,
+                "pb": score_pb,
+                "peg": score_peg,
+                "croissance": score_croissance,
+                "endettement": score_endettement,
+                "final": score_final
+            },
+            "conclusion": conclusion,
+            "recommandation": recommandation
+        }
+        
+        if verbose:
+            self._afficher_rapport(resultat, {
+                "pe": explication_pe,
+                "pb": explication_pb,
+                "peg": explication_peg,
+                "croissance": explication_croissance,
+                "endettement": explication_endettement
+            })
+        
+        return resultat
+    
+    def _afficher_rapport(self, resultat: Dict, explications: Dict[str, str]) -> None:
+        """
+        Affiche le rapport détaillé d'une analyse produite par analyser_entreprise
+        """
+        ratios = resultat["ratios"]
+        scores = resultat["scores"]
+        pe_ratio = ratios["pe"]
+        peg_ratio = ratios["peg"]
+        ratio_endettement = ratios["ratio_endettement"]
+        
+        print(f"\n🔍 ANALYSE DE {resultat['entreprise'].upper()}")
+        print("=" * 50)
         
-        # Affichage des résultats
         print(f"\n📊 RATIOS CALCULÉS:")
         print(f"  • P/E Ratio: {pe_ratio:.2f}" if pe_ratio != float('inf') else "  • P/E Ratio: N/A (pas de bénéfices)")
-        print(f"  • P/B Ratio: {pb_ratio:.2f}")
+        print(f"  • P/B Ratio: {ratios['pb']:.2f}")
         print(f"  • PEG Ratio: {peg_ratio:.2f}" if peg_ratio != float('inf') else "  • PEG Ratio: N/A")
-        print(f"  • Croissance revenus: {croissance_revenus:.1f}%")
+        print(f"  • Croissance revenus: {ratios['croissance_revenus']:.1f}%")
         print(f"  • Ratio endettement: {ratio_endettement:.2f}" if ratio_endettement != float('inf') else "  • Ratio endettement: N/A")
         
         print(f"\n📈 ÉVALUATIONS DÉTAILLÉES:")
-        print(f"  • P/E: {score_pe}/100 - {explication_pe}")
-        print(f"  • P/B: {score_pb}/100 - {explication_pb}")
-        print(f"  • PEG: {score_peg}/100 - {explication_peg}")
-        print(f"  • Croissance: {score_croissance}/100 - {explication_croissance}")
-        print(f"  • Endettement: {score_endettement}/100 - {explication_endettement}")
+        print(f"  • P/E: {scores['pe']}/100 - {explications['pe']}")
+        print(f"  • P/B: {scores['pb']}/100 - {explications['pb']}")
+        print(f"  • PEG: {scores['peg']}/100 - {explications['peg']}")
+        print(f"  • Croissance: {scores['croissance']}/100 - {explications['croissance']}")
+        print(f"  • Endettement: {scores['endettement']}/100 - {explications['endettement']}")
         
         print(f"\n🎯 RÉSULTAT FINAL:")
-        print(f"  Score global: {score_final:.1f}/100")
-        print(f"  Conclusion: {conclusion}")
-        print(f"  Recommandation: {recommandation}")
+        print(f"  Score global: {scores['final']:.1f}/100")
+        print(f"  Conclusion: {resultat['conclusion']}")
+        print(f"  Recommandation: {resultat['recommandation']}")
+    
+    def analyser_portefeuille(self, entreprises: List[DonneesEntreprise]) -> Dict:
+        """
+        Analyse un ensemble d'entreprises en une seule passe vectorisée (sans affichage)
+        Mêmes règles que analyser_entreprise, chaque valeur du résultat est un tableau
+        Utilise le noyau compilé par Numba s'il est installé, NumPy sinon
+        """
+        p = PortefeuilleSoA.depuis_donnees(entreprises, self.index_secteurs,
+                                           self.index_secteurs["defaut"])
+        
+        noyau = _noyau_numba()
+        if noyau is not None:
+            resultats = noyau(
+                p.prix, p.eps, p.bvps, p.revenus_actuels, p.revenus_precedents, p.dette,
+                p.capitaux_propres, p.croissance_prevue, p.secteur_id, self._tables_numpy()["secteurs"],
+                *self._baremes_numba()
+            )
+        else:
+            resultats = self._noter_portefeuille_numpy(p)
+        
+        (pe_ratio, pb_ratio, peg_ratio, croissance_revenus, ratio_endettement,
+         score_pe, score_pb, score_peg, score_croissance, score_endettement,
+         score_final, paliers) = resultats
         
         return {
-            "entreprise": donnees.nom,
-            "secteur": donnees.secteur,
+            "entreprises": p.noms,
             "ratios": {
                 "pe": pe_ratio,
                 "pb": pb_ratio,
@@ -524,9 +1221,80 @@ class AnalyseurSousEvaluation:
                 "endettement": score_endettement,
                 "final": score_final
             },
-            "conclusion": conclusion,
-            "recommandation": recommandation
+            "conclusion": [self._CONCLUSIONS[i][0] for i in paliers],
+            "recommandation": [self._CONCLUSIONS[i][1] for i in paliers]
         }
+    
+    def _baremes_numba(self) -> Tuple["np.ndarray", ...]:
+        """
+        Barèmes de notation sous forme de tableaux, dans l'ordre attendu par le noyau Numba
+        """
+        import numpy as np
+        
+        tables = self._tables_numpy()
+        poids = self._POIDS
+        return (
+            np.array(self._SEUILS_PE, dtype=np.float64), tables["notes_pe"],
+            np.array(self._SEUILS_PB, dtype=np.float64), tables["notes_pb"],
+            np.array(self._SEUILS_PEG, dtype=np.float64), tables["notes_peg"],
+            tables["notes_croissance"],
+            np.array(self._SEUILS_ENDETTEMENT, dtype=np.float64), tables["notes_endettement"],
+            np.array(self._SEUILS_CONCLUSION, dtype=np.float64),
+            np.array([poids["pe"], poids["pb"], poids["peg"], poids["croissance"], poids["endettement"]])
+        )
+    
+    def _noter_portefeuille_numpy(self, p: PortefeuilleSoA) -> Tuple["np.ndarray", ...]:
+        """
+        Calcule ratios, scores, score final et palier de conclusion avec des opérations NumPy
+        """
+        import numpy as np
+        
+        tables = self._tables_numpy()
+        references = tables["secteurs"][p.secteur_id]
+        pe_ref, pb_ref, croissance_ref = references[:, 0], references[:, 1], references[:, 2]
+        inf = np.inf
+        
+        # Ratios (mêmes conventions que les méthodes calculer_*)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pe_ratio = np.where(p.eps > 0, p.prix / p.eps, inf)
+            pb_ratio = np.where(p.bvps > 0, p.prix / p.bvps, inf)
+            peg_ratio = np.where((pe_ratio != inf) & (p.croissance_prevue > 0),
+                                 pe_ratio / p.croissance_prevue, inf)
+            croissance_revenus = np.where(
+                p.revenus_precedents > 0,
+                (p.revenus_actuels - p.revenus_precedents) / p.revenus_precedents * 100, 0.0)
+            ratio_endettement = np.where(p.capitaux_propres > 0, p.dette / p.capitaux_propres, inf)
+            
+            # Scores: recherche du palier puis lecture dans la table des notes
+            # (P/E et P/B: seuils propres à chaque ligne, comparés comme valeur < référence * seuil)
+            palier_pe = sum((~(pe_ratio < pe_ref * seuil)).astype(np.intp) for seuil in self._SEUILS_PE)
+            palier_pb = sum((~(pb_ratio < pb_ref * seuil)).astype(np.intp) for seuil in self._SEUILS_PB)
+            score_pe = np.where(pe_ratio == inf, 0, tables["notes_pe"][palier_pe])
+            score_pb = tables["notes_pb"][palier_pb]
+        
+        score_peg = np.where(peg_ratio == inf, 20, tables["notes_peg"][
+            np.searchsorted(self._SEUILS_PEG, peg_ratio, side="right")])
+        palier_croissance = ((croissance_revenus > 0).astype(np.intp) +
+                             (croissance_revenus > croissance_ref) +
+                             (croissance_revenus > croissance_ref * 1.5))
+        score_croissance = tables["notes_croissance"][palier_croissance]
+        score_endettement = np.where(ratio_endettement == inf, 0, tables["notes_endettement"][
+            np.searchsorted(self._SEUILS_ENDETTEMENT, ratio_endettement, side="right")])
+        
+        poids = self._POIDS
+        score_final = (
+            score_pe * poids["pe"] +
+            score_pb * poids["pb"] +
+            score_peg * poids["peg"] +
+            score_croissance * poids["croissance"] +
+            score_endettement * poids["endettement"]
+        )
+        
+        paliers = np.searchsorted(self._SEUILS_CONCLUSION, score_final, side="right")
+        
+        return (pe_ratio, pb_ratio, peg_ratio, croissance_revenus, ratio_endettement,
+                score_pe, score_pb, score_peg, score_croissance, score_endettement,
+                score_final, paliers)
 
 
 def analyser_entreprise_par_nom(nom_entreprise: str, api_key: str = "demo") -> bool:
@@ -659,6 +1427,161 @@ def exemple_analyse():
     analyseur.analyser_entreprise(entreprise_sous_evaluee)
 
 
+# Textes fixes du menu, assemblés une seule fois et écrits en un seul appel
+_TEXTE_MENU = "\n".join((
+    "\nQue souhaitez-vous faire ?",
+    "1. 🤖 Analyser une entreprise automatiquement (via API)",
+    "2. ✏️  Analyser une entreprise manuellement (saisie des données)",
+    "3. 🎯 Voir des exemples d'analyses",
+    "4. 🔑 Configurer/Changer la clé API",
+    "5. ❓ Aide sur l'utilisation des APIs",
+    "6. 🚪 Quitter"
+)) + "\n"
+
+_TEXTE_AIDE = "\n".join((
+    "\n📚 AIDE SUR LES APIS FINANCIÈRES",
+    "=" * 40,
+    "🔹 Alpha Vantage (recommandé):",
+    "   - Gratuit: 5 requêtes/minute, 500/jour",
+    "   - Inscription: https://www.alphavantage.co/support/#api-key",
+    "   - Données: Entreprises mondiales cotées en bourse",
+    "",
+    "🔹 Conseils d'utilisation:",
+    "   - Utilisez les symboles boursiers pour plus de précision (ex: AAPL)",
+    "   - Les entreprises non cotées ne sont pas disponibles",
+    "   - Au-delà de 5 requêtes/minute, le programme patiente automatiquement",
+    "",
+    "🔹 Symboles boursiers populaires:",
+    "   - Apple: AAPL",
+    "   - Microsoft: MSFT",
+    "   - Google: GOOGL",
+    "   - Tesla: TSLA",
+    "   - Amazon: AMZN",
+    "   - Meta: META",
+    "   - Netflix: NFLX"
+)) + "\n"
+
+_TEXTE_SORTIE = "\n".join((
+    "\n👋 Merci d'avoir utilisé l'analyseur!",
+    "💡 N'oubliez pas:",
+    "   - Cette analyse est à des fins éducatives",
+    "   - Consultez toujours un conseiller financier",
+    "   - Diversifiez vos investissements",
+    "\nBonne chance avec vos investissements! 📈"
+)) + "\n"
+
+
+def _choix_analyse_automatique(etat: Dict[str, Optional[str]]) -> bool:
+    """
+    Menu 1: analyse automatique via API
+    """
+    if not etat["api_key"]:
+        print("\n🔑 Configuration de la clé API nécessaire:")
+        etat["api_key"] = configurer_api_key()
+    
+    nom_entreprise = input("\n📝 Entrez le nom de l'entreprise (ou symbole boursier): ").strip()
+    if nom_entreprise:
+        try:
+            print(f"\n⏳ Analyse en cours de '{nom_entreprise}'...")
+            succes = analyser_entreprise_par_nom(nom_entreprise, etat["api_key"])
+            if not succes:
+                print("\n💡 Voulez-vous essayer avec un autre nom ou saisir les données manuellement ?")
+        except Exception as e:
+            print(f"❌ Erreur lors de l'analyse automatique: {e}")
+            print("💡 Essayez l'analyse manuelle (option 2)")
+    else:
+        print("❌ Veuillez entrer un nom d'entreprise.")
+    return True
+
+
+def _choix_analyse_manuelle(etat: Dict[str, Optional[str]]) -> bool:
+    """
+    Menu 2: analyse manuelle
+    """
+    try:
+        donnees = saisir_donnees_entreprise()
+        analyseur = AnalyseurSousEvaluation()
+        analyseur.analyser_entreprise(donnees)
+    except ValueError:
+        print("❌ Erreur: Veuillez saisir des valeurs numériques valides.")
+    except Exception as e:
+        print(f"❌ Erreur inattendue: {e}")
+    return True
+
+
+def _choix_exemples(etat: Dict[str, Optional[str]]) -> bool:
+    """
+    Menu 3: exemples d'analyses
+    """
+    exemple_analyse()
+    return True
+
+
+def _choix_cle_api(etat: Dict[str, Optional[str]]) -> bool:
+    """
+    Menu 4: configuration de la clé API
+    """
+    api_key = configurer_api_key()
+    etat["api_key"] = api_key
+    print(f"✅ Clé API configurée: {api_key[:10]}..." if len(api_key) > 10 else f"✅ Clé API configurée: {api_key}")
+    return True
+
+
+def _choix_aide(etat: Dict[str, Optional[str]]) -> bool:
+    """
+    Menu 5: aide sur les APIs
+    """
+    sys.stdout.write(_TEXTE_AIDE)
+    return True
+
+
+def _choix_quitter(etat: Dict[str, Optional[str]]) -> bool:
+    """
+    Menu 6: quitter (retourne False pour sortir de la boucle principale)
+    """
+    sys.stdout.write(_TEXTE_SORTIE)
+    return False
+
+
+def _choix_invalide(etat: Dict[str, Optional[str]]) -> bool:
+    """
+    Choix hors menu
+    """
+    print("❌ Choix invalide. Veuillez choisir entre 1 et 6.")
+    return True
+
+
+# Entrée non interactive (tube, script): le choix du menu est lu directement sur stdin
+_INTERACTIF = sys.stdin is not None and sys.stdin.isatty()
+
+
+def _lire_choix(invite: str) -> Optional[str]:
+    """
+    Lit le choix de l'utilisateur dans le menu principal (None en fin d'entrée)
+    Hors terminal, évite input() et sa gestion de l'édition de ligne
+    """
+    if _INTERACTIF:
+        return input(invite)
+    
+    sys.stdout.write(invite)
+    sys.stdout.flush()
+    ligne = sys.stdin.readline()
+    if not ligne:
+        return None
+    return ligne.rstrip("\n")
+
+
+# Actions du menu principal: chaque action retourne False pour quitter le programme
+_MENU = {
+    "1": _choix_analyse_automatique,
+    "2": _choix_analyse_manuelle,
+    "3": _choix_exemples,
+    "4": _choix_cle_api,
+    "5": _choix_aide,
+    "6": _choix_quitter
+}
+
+
 def main():
     """
     Fonction principale du programme
@@ -672,90 +1595,18 @@ def main():
     print("   Tapez juste le nom de l'entreprise et laissez-nous faire le reste.")
     print()
     
-    # Variable pour stocker la clé API
-    api_key = None
+    # État partagé entre les actions du menu (clé API saisie)
+    etat = {"api_key": None}
     
     while True:
-        print("\nQue souhaitez-vous faire ?")
-        print("1. 🤖 Analyser une entreprise automatiquement (via API)")
-        print("2. ✏️  Analyser une entreprise manuellement (saisie des données)")
-        print("3. 🎯 Voir des exemples d'analyses")
-        print("4. 🔑 Configurer/Changer la clé API")
-        print("5. ❓ Aide sur l'utilisation des APIs")
-        print("6. 🚪 Quitter")
-        
-        choix = input("\nVotre choix (1-6): ")
-        
-        if choix == "1":
-            # Analyse automatique via API
-            if not api_key:
-                print("\n🔑 Configuration de la clé API nécessaire:")
-                api_key = configurer_api_key()
-            
-            nom_entreprise = input("\n📝 Entrez le nom de l'entreprise (ou symbole boursier): ").strip()
-            if nom_entreprise:
-                try:
-                    print(f"\n⏳ Analyse en cours de '{nom_entreprise}'...")
-                    succes = analyser_entreprise_par_nom(nom_entreprise, api_key)
-                    if not succes:
-                        print("\n💡 Voulez-vous essayer avec un autre nom ou saisir les données manuellement ?")
-                except Exception as e:
-                    print(f"❌ Erreur lors de l'analyse automatique: {e}")
-                    print("💡 Essayez l'analyse manuelle (option 2)")
-            else:
-                print("❌ Veuillez entrer un nom d'entreprise.")
+        sys.stdout.write(_TEXTE_MENU)
         
-        elif choix == "2":
-            # Analyse manuelle
-            try:
-                donnees = saisir_donnees_entreprise()
-                analyseur = AnalyseurSousEvaluation()
-                resultat = analyseur.analyser_entreprise(donnees)
-            except ValueError:
-                print("❌ Erreur: Veuillez saisir des valeurs numériques valides.")
-            except Exception as e:
-                print(f"❌ Erreur inattendue: {e}")
-        
-        elif choix == "3":
-            exemple_analyse()
-        
-        elif choix == "4":
-            api_key = configurer_api_key()
-            print(f"✅ Clé API configurée: {api_key[:10]}..." if len(api_key) > 10 else f"✅ Clé API configurée: {api_key}")
-        
-        elif choix == "5":
-            print("\n📚 AIDE SUR LES APIS FINANCIÈRES")
-            print("=" * 40)
-            print("🔹 Alpha Vantage (recommandé):")
-            print("   - Gratuit: 5 requêtes/minute, 500/jour")
-            print("   - Inscription: https://www.alphavantage.co/support/#api-key")
-            print("   - Données: Entreprises mondiales cotées en bourse")
-            print()
-            print("🔹 Conseils d'utilisation:")
-            print("   - Utilisez les symboles boursiers pour plus de précision (ex: AAPL)")
-            print("   - Les entreprises non cotées ne sont pas disponibles")
-            print("   - Attendez quelques secondes entre les analyses")
-            print()
-            print("🔹 Symboles boursiers populaires:")
-            print("   - Apple: AAPL")
-            print("   - Microsoft: MSFT")
-            print("   - Google: GOOGL")
-            print("   - Tesla: TSLA")
-            print("   - Amazon: AMZN")
-            print("   - Meta: META")
-            print("   - Netflix: NFLX")
-        
-        elif choix == "6":
-            print("\n👋 Merci d'avoir utilisé l'analyseur!")
-            print("💡 N'oubliez pas:")
-            print("   - Cette analyse est à des fins éducatives")
-            print("   - Consultez toujours un conseiller financier")
-            print("   - Diversifiez vos investissements")
-            print("\nBonne chance avec vos investissements! 📈")
+        choix = _lire_choix("\nVotre choix (1-6): ")
+        if choix is None:  # Fin de l'entrée redirigée
             break
         
-        else:
-            print("❌ Choix invalide. Veuillez choisir entre 1 et 6.")
+        if not _MENU.get(choix, _choix_invalide)(etat):
+            break
 
 
 if __name__ == "__main__":